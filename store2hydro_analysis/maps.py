@@ -30,23 +30,40 @@ except ImportError:
     HAS_CARTOPY = False
     print("[maps.py] Cartopy nicht verfügbar – einfache Scatter-Karten werden verwendet.")
 
+if HAS_CARTOPY:
+    # Eine gemeinsame Projektion für Achsen und Daten: Busse liegen bereits in
+    # lon/lat vor, mit transform == Achsen-Projektion entfällt jede Umprojektion
+    _PROJECTION = ccrs.PlateCarree()
+    # Kartenfeatures mit automatischer Auflösung (110m/50m/10m je nach Ausschnitt),
+    # damit Länder-Karten (FR, DE) ausreichend detaillierte Grenzen/Küsten bekommen.
+    # Cartopy cached die geladenen Geometrien je Feature und Auflösung.
+    _MAP_FEATURES = (
+        (cfeature.BORDERS,   {"linewidth": 0.5, "edgecolor": "gray"}),
+        (cfeature.COASTLINE, {"linewidth": 0.5}),
+        (cfeature.LAND,      {"facecolor": "#f5f5f0"}),
+        (cfeature.OCEAN,     {"facecolor": "#d6eaf8"}),
+    )
+
 
 # ---------------------------------------------------------------------------
 # Hilfsfunktion: Achse mit Kartenhintergrund
 # ---------------------------------------------------------------------------
+def _add_map_background(ax):
+    """Zeichnet Grenzen, Küsten, Land und Meer auf eine Cartopy-Achse."""
+    for feature, kwargs in _MAP_FEATURES:
+        ax.add_feature(feature, **kwargs)
+
+
 def _make_map_axes(extent=None):
     """Erstellt eine Axes mit optionalem Cartopy-Hintergrund."""
     if HAS_CARTOPY:
         fig, ax = plt.subplots(
             figsize=(10, 8),
-            subplot_kw={"projection": ccrs.PlateCarree()}
+            subplot_kw={"projection": _PROJECTION}
         )
-        ax.add_feature(cfeature.BORDERS, linewidth=0.5, edgecolor="gray")
-        ax.add_feature(cfeature.COASTLINE, linewidth=0.5)
-        ax.add_feature(cfeature.LAND, facecolor="#f5f5f0")
-        ax.add_feature(cfeature.OCEAN, facecolor="#d6eaf8")
+        _add_map_background(ax)
         if extent:
-            ax.set_extent(extent, crs=ccrs.PlateCarree())
+            ax.set_extent(extent, crs=_PROJECTION)
     else:
         fig, ax = plt.subplots(figsize=(10, 8))
         ax.set_facecolor("#f5f5f0")
@@ -55,10 +72,15 @@ def _make_map_axes(extent=None):
 
 
 def _scatter_kwargs():
-    """Gibt kwargs für cartopy-kompatibles scatter zurück."""
+    """
+    Gibt kwargs für cartopy-kompatibles scatter zurück.
+
+    rasterized=True: Marker werden auch bei PDF/SVG-Export als Bild eingebettet
+    statt als einzelne Pfade (kleinere Dateien, schnelleres Zeichnen).
+    """
     if HAS_CARTOPY:
-        return {"transform": ccrs.PlateCarree(), "zorder": 5}
-    return {"zorder": 5}
+        return {"transform": _PROJECTION, "zorder": 5, "rasterized": True}
+    return {"zorder": 5, "rasterized": True}
 
 
 # ---------------------------------------------------------------------------
@@ -88,7 +110,7 @@ def plot_retrofit_decisions(networks_per_scenario: dict, outdir: str):
         fig, axes = plt.subplots(
             1, n_periods,
             figsize=(6 * n_periods, 7),
-            subplot_kw={"projection": ccrs.PlateCarree()} if HAS_CARTOPY else {}
+            subplot_kw={"projection": _PROJECTION} if HAS_CARTOPY else {}
         )
         if n_periods == 1:
             axes = [axes]
@@ -98,14 +120,11 @@ def plot_retrofit_decisions(networks_per_scenario: dict, outdir: str):
 
             # Kartenhintergrund
             if HAS_CARTOPY:
-                ax.add_feature(cfeature.BORDERS, linewidth=0.5, edgecolor="gray")
-                ax.add_feature(cfeature.COASTLINE, linewidth=0.5)
-                ax.add_feature(cfeature.LAND, facecolor="#f5f5f0")
-                ax.add_feature(cfeature.OCEAN, facecolor="#d6eaf8")
+                _add_map_background(ax)
 
             # Alle Busse als graue Punkte
-            bus_x = n.buses["x"]
-            bus_y = n.buses["y"]
+            bus_x = n.buses["x"].to_numpy()
+            bus_y = n.buses["y"].to_numpy()
             ax.scatter(bus_x, bus_y, s=10, color="lightgray",
                        alpha=0.6, **_scatter_kwargs())
 
@@ -113,18 +132,23 @@ def plot_retrofit_decisions(networks_per_scenario: dict, outdir: str):
             investment = get_investment_status(n)
             retrofit_units = get_retrofit_units(n)
 
-            for unit in retrofit_units:
-                bus = n.storage_units.at[unit, "bus"]
-                if bus not in n.buses.index:
+            # Koordinaten aller Units auf einmal nachschlagen statt .at pro Unit
+            unit_bus = n.storage_units.loc[list(retrofit_units), "bus"]
+            unit_bus = unit_bus[unit_bus.isin(n.buses.index)]
+            xy = n.buses.loc[unit_bus.values, ["x", "y"]].to_numpy()
+            invested = np.array([bool(investment.get(unit, False))
+                                 for unit in unit_bus.index], dtype=bool)
+
+            # Ein scatter je Status statt einer pro Unit
+            for mask, color, marker in ((invested, "#2ca02c", "^"),
+                                        (~invested, "#d62728", "x")):
+                if not mask.any():
                     continue
-                x = n.buses.at[bus, "x"]
-                y = n.buses.at[bus, "y"]
-                invested = investment.get(unit, False)
-                color = "#2ca02c" if invested else "#d62728"
-                marker = "^" if invested else "x"
-                ax.scatter(x, y, s=120, color=color, marker=marker,
-                           edgecolors="black", linewidths=0.5,
+                ax.scatter(xy[mask, 0], xy[mask, 1], s=120, color=color,
+                           marker=marker, edgecolors="black", linewidths=0.5,
                            **_scatter_kwargs())
+
+            for unit, (x, y) in zip(unit_bus.index, xy):
                 ax.annotate(
                     unit[:15],  # Name kürzen
                     (x, y), fontsize=6, ha="center", va="bottom",
@@ -169,7 +193,7 @@ def plot_storage_capacity_map(networks_per_scenario: dict, outdir: str,
         fig, axes = plt.subplots(
             1, n_periods,
             figsize=(6 * n_periods, 7),
-            subplot_kw={"projection": ccrs.PlateCarree()} if HAS_CARTOPY else {}
+            subplot_kw={"projection": _PROJECTION} if HAS_CARTOPY else {}
         )
         if n_periods == 1:
             axes = [axes]
@@ -185,13 +209,10 @@ def plot_storage_capacity_map(networks_per_scenario: dict, outdir: str,
             n = periods[period]
 
             if HAS_CARTOPY:
-                ax.add_feature(cfeature.BORDERS, linewidth=0.5, edgecolor="gray")
-                ax.add_feature(cfeature.COASTLINE, linewidth=0.5)
-                ax.add_feature(cfeature.LAND, facecolor="#f5f5f0")
-                ax.add_feature(cfeature.OCEAN, facecolor="#d6eaf8")
+                _add_map_background(ax)
 
             # Alle Busse
-            ax.scatter(n.buses["x"], n.buses["y"],
+            ax.scatter(n.buses["x"].to_numpy(), n.buses["y"].to_numpy(),
                        s=8, color="lightgray", alpha=0.4, **_scatter_kwargs())
 
             for carrier in carriers:
@@ -199,19 +220,16 @@ def plot_storage_capacity_map(networks_per_scenario: dict, outdir: str,
                 if not units:
                     continue
                 color = COLORS.get(carrier, "gray")
-                for unit in units:
-                    bus = n.storage_units.at[unit, "bus"]
-                    if bus not in n.buses.index:
-                        continue
-                    cap = n.storage_units.at[unit, "p_nom_opt"]
-                    if cap < 1e-3:
-                        continue
-                    x = n.buses.at[bus, "x"]
-                    y = n.buses.at[bus, "y"]
-                    size = 50 + 800 * (cap / max_cap)   # Skalierung: 50–850 pt²
-                    ax.scatter(x, y, s=size, color=color, alpha=0.7,
-                               edgecolors="black", linewidths=0.4,
-                               **_scatter_kwargs())
+                # Alle Units eines Carriers in einem scatter-Aufruf (ein Artist statt einer pro Unit)
+                su = n.storage_units.loc[list(units), ["bus", "p_nom_opt"]]
+                su = su[su["bus"].isin(n.buses.index) & (su["p_nom_opt"] >= 1e-3)]
+                if su.empty:
+                    continue
+                xy = n.buses.loc[su["bus"], ["x", "y"]].to_numpy()
+                sizes = 50 + 800 * (su["p_nom_opt"].to_numpy() / max_cap)   # Skalierung: 50–850 pt²
+                ax.scatter(xy[:, 0], xy[:, 1], s=sizes, color=color, alpha=0.7,
+                           edgecolors="black", linewidths=0.4,
+                           **_scatter_kwargs())
 
             ax.set_title(f"{period}  (max={max_cap:.0f} MW)", fontsize=11)
 